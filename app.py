@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 
 import pandas as pd
 import streamlit as st
@@ -14,6 +14,7 @@ from db import (
     get_metrics_for_day,
     get_setting,
     init_db,
+    iter_completion_history,
     reset_day,
     set_setting,
     upsert_check,
@@ -130,13 +131,59 @@ def render_insights_tab() -> None:
     history_14 = completion_history(PROTOCOL, days=14)
     display_14 = history_14.copy()
     display_14["day"] = pd.to_datetime(display_14["day"]).dt.strftime("%Y-%m-%d")
-    display_14 = display_14.rename(columns={"day": "Date", "done": "Done", "total": "Total", "pct": "Completion %"})
+    display_14 = _format_history_page(display_14)
 
     st.dataframe(display_14, use_container_width=True, hide_index=True)
 
     streak = current_streak(PROTOCOL, threshold_pct=70.0)
     st.metric("Current Streak (>= 70%)", f"{streak} day(s)")
 
+    st.divider()
+    render_history_browser()
+
+
+def _format_history_page(page: pd.DataFrame) -> pd.DataFrame:
+    return page.rename(columns={"day": "Date", "done": "Done", "total": "Total", "pct": "Completion %"})
+
+
+def render_history_browser() -> None:
+    st.markdown("**History Browser**")
+
+    today = date.today()
+    col1, col2, col3 = st.columns(3)
+    start = col1.date_input("From", value=today - timedelta(days=365), max_value=today, key="history_from")
+    end = col2.date_input("To", value=today, max_value=today, key="history_to")
+    page_size = col3.selectbox("Page size", [14, 30, 60, 90], index=1, key="history_page_size")
+
+    if start > end:
+        st.error("From date must be on or before To date.")
+        return
+
+    # Keyset cursors: each entry is the last day before a page starts.
+    query = (start.isoformat(), end.isoformat(), page_size)
+    if st.session_state.get("history_query") != query:
+        st.session_state["history_query"] = query
+        st.session_state["history_cursors"] = [start - timedelta(days=1)]
+    cursors = st.session_state["history_cursors"]
+
+    pages = iter_completion_history(PROTOCOL, cursors[-1] + timedelta(days=1), end, page_size=page_size)
+    page = next(pages, None)
+    if page is None:
+        st.caption("No days in range.")
+        return
+
+    st.dataframe(_format_history_page(page), use_container_width=True, hide_index=True)
+    last_day = date.fromisoformat(page["day"].iloc[-1])
+    st.caption(f"Page {len(cursors)}: {page['day'].iloc[0]} to {page['day'].iloc[-1]}")
+
+    prev_col, next_col = st.columns(2)
+    if prev_col.button("Previous", disabled=len(cursors) == 1, use_container_width=True):
+        cursors.pop()
+        st.rerun()
+    if next_col.button("Next", disabled=last_day >= end, use_container_width=True):
+        cursors.append(last_day)
+        st.rerun()
+
 
 def render_coach_tab(day: str) -> None:
     st.subheader("Coach")
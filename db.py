@@ -1,23 +1,125 @@
 from __future__ import annotations
 
+import queue
 import sqlite3
+import threading
+from concurrent.futures import Future
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator, Sequence
 
 import pandas as pd
 
 DB_PATH = Path("reset.db")
+BUSY_TIMEOUT_SECONDS = 10.0
+WRITE_BATCH_MAX = 256
+
+Statement = tuple[str, Sequence[Any]]
 
 
 def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn = sqlite3.connect(DB_PATH, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def get_read_conn() -> sqlite3.Connection:
+    uri = f"{DB_PATH.resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
     conn.row_factory = sqlite3.Row
     return conn
 
 
+class _Writer:
+    # Single writer thread: every session queues its statements here and the
+    # thread commits whatever is waiting as one transaction (group commit).
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._jobs: queue.Queue[tuple[list[Statement], Future[None]]] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, statements: list[Statement]) -> Future[None]:
+        future: Future[None] = Future()
+        self._jobs.put((statements, future))
+        return future
+
+    def _run(self) -> None:
+        conn: sqlite3.Connection | None = None
+        while True:
+            batch = [self._jobs.get()]
+            while len(batch) < WRITE_BATCH_MAX:
+                try:
+                    batch.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                if conn is None:
+                    conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, isolation_level=None)
+                self._commit_batch(conn, batch)
+            except BaseException as exc:
+                # Fail this batch and reconnect on the next one; the thread must outlive any error.
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except sqlite3.Error:
+                        pass
+                    conn = None
+
+    def _commit_batch(
+        self, conn: sqlite3.Connection, batch: list[tuple[list[Statement], Future[None]]]
+    ) -> None:
+        results: list[BaseException | None] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for statements, _ in batch:
+                conn.execute("SAVEPOINT job")
+                try:
+                    for sql, params in statements:
+                        conn.execute(sql, params)
+                except sqlite3.Error as exc:
+                    conn.execute("ROLLBACK TO job")
+                    results.append(exc)
+                else:
+                    results.append(None)
+                conn.execute("RELEASE job")
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                try:
+                    conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+            raise
+        for (_, future), error in zip(batch, results):
+            if error is None:
+                future.set_result(None)
+            else:
+                future.set_exception(error)
+
+
+_writer: _Writer | None = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _Writer:
+    global _writer
+    with _writer_lock:
+        if _writer is None or _writer.path != DB_PATH or not _writer._thread.is_alive():
+            _writer = _Writer(DB_PATH)
+        return _writer
+
+
+def _write(*statements: Statement) -> None:
+    _get_writer().submit(list(statements)).result()
+
+
 def init_db() -> None:
     with get_conn() as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS checks (
@@ -52,7 +154,7 @@ def init_db() -> None:
 
 
 def get_checks_for_day(day: str) -> dict[tuple[str, str], bool]:
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         rows = conn.execute(
             "SELECT section, item, checked FROM checks WHERE day = ?", (day,)
         ).fetchall()
@@ -60,8 +162,8 @@ def get_checks_for_day(day: str) -> dict[tuple[str, str], bool]:
 
 
 def upsert_check(day: str, section: str, item: str, checked: bool) -> None:
-    with get_conn() as conn:
-        conn.execute(
+    _write(
+        (
             """
             INSERT INTO checks (day, section, item, checked)
             VALUES (?, ?, ?, ?)
@@ -70,11 +172,11 @@ def upsert_check(day: str, section: str, item: str, checked: bool) -> None:
             """,
             (day, section, item, int(checked)),
         )
-        conn.commit()
+    )
 
 
 def get_metrics_for_day(day: str) -> dict[str, Any] | None:
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         row = conn.execute(
             """
             SELECT sleep_hours, energy, time_available, notes
@@ -100,8 +202,8 @@ def upsert_metrics(
     time_available: int,
     notes: str,
 ) -> None:
-    with get_conn() as conn:
-        conn.execute(
+    _write(
+        (
             """
             INSERT INTO daily_metrics (day, sleep_hours, energy, time_available, notes)
             VALUES (?, ?, ?, ?, ?)
@@ -114,14 +216,14 @@ def upsert_metrics(
             """,
             (day, sleep_hours, energy, time_available, notes.strip()),
         )
-        conn.commit()
+    )
 
 
 def reset_day(day: str) -> None:
-    with get_conn() as conn:
-        conn.execute("DELETE FROM checks WHERE day = ?", (day,))
-        conn.execute("DELETE FROM daily_metrics WHERE day = ?", (day,))
-        conn.commit()
+    _write(
+        ("DELETE FROM checks WHERE day = ?", (day,)),
+        ("DELETE FROM daily_metrics WHERE day = ?", (day,)),
+    )
 
 
 def completion_for_day(day: str, protocol: dict[str, list[str]]) -> dict[str, float | int | str]:
@@ -137,19 +239,76 @@ def completion_for_day(day: str, protocol: dict[str, list[str]]) -> dict[str, fl
     return {"day": day, "done": done, "total": total, "pct": round(pct, 1)}
 
 
+def _protocol_items_cte(protocol: dict[str, list[str]]) -> tuple[str, list[str]]:
+    pairs = [(section, item) for section, items in protocol.items() for item in items]
+    if not pairs:
+        return "SELECT NULL AS section, NULL AS item WHERE 0", []
+    values = ", ".join("(?, ?)" for _ in pairs)
+    return f"VALUES {values}", [value for pair in pairs for value in pair]
+
+
+def completion_history_page(
+    protocol: dict[str, list[str]],
+    after: date,
+    end: date,
+    limit: int = 30,
+) -> pd.DataFrame:
+    # Keyset pagination on day: pass the last day of a page as `after` for the next one.
+    protocol_sql, protocol_params = _protocol_items_cte(protocol)
+    with get_read_conn() as conn:
+        rows = conn.execute(
+            f"""
+            WITH RECURSIVE days(day) AS (
+                SELECT date(?, '+1 day')
+                UNION ALL
+                SELECT date(day, '+1 day') FROM days WHERE day < ?
+                LIMIT ?
+            ),
+            protocol_items(section, item) AS ({protocol_sql})
+            SELECT d.day AS day, COUNT(p.item) AS done
+            FROM days d
+            LEFT JOIN checks c ON c.day = d.day AND c.checked = 1
+            LEFT JOIN protocol_items p ON p.section = c.section AND p.item = c.item
+            WHERE d.day <= ?
+            GROUP BY d.day
+            ORDER BY d.day
+            """,
+            (after.isoformat(), end.isoformat(), limit, *protocol_params, end.isoformat()),
+        ).fetchall()
+    total = len(protocol_params) // 2
+    page = pd.DataFrame([tuple(r) for r in rows], columns=["day", "done"])
+    page["done"] = page["done"].astype(int)
+    page["total"] = total
+    page["pct"] = (page["done"] / total * 100.0).round(1) if total else 0.0
+    return page
+
+
+def iter_completion_history(
+    protocol: dict[str, list[str]],
+    start: date,
+    end: date,
+    page_size: int = 30,
+) -> Iterator[pd.DataFrame]:
+    after = start - timedelta(days=1)
+    while after < end:
+        page = completion_history_page(protocol, after=after, end=end, limit=page_size)
+        if page.empty:
+            return
+        yield page
+        after = date.fromisoformat(page["day"].iloc[-1])
+
+
 def completion_history(protocol: dict[str, list[str]], days: int = 60) -> pd.DataFrame:
     end = date.today()
     start = end - timedelta(days=days - 1)
-    records = []
-    cursor = start
-    while cursor <= end:
-        records.append(completion_for_day(cursor.isoformat(), protocol))
-        cursor += timedelta(days=1)
-    return pd.DataFrame(records)
+    pages = list(iter_completion_history(protocol, start, end, page_size=max(days, 1)))
+    if not pages:
+        return pd.DataFrame(columns=["day", "done", "total", "pct"])
+    return pd.concat(pages, ignore_index=True)
 
 
 def current_streak(protocol: dict[str, list[str]], threshold_pct: float = 70.0) -> int:
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         row = conn.execute(
             """
             SELECT MIN(day) AS first_day
@@ -179,7 +338,7 @@ def current_streak(protocol: dict[str, list[str]], threshold_pct: float = 70.0)
 
 
 def get_setting(key: str, default: str = "") -> str:
-    with get_conn() as conn:
+    with get_read_conn() as conn:
         row = conn.execute("SELECT value FROM app_settings WHERE key = ?", (key,)).fetchone()
     if not row or row["value"] is None:
         return default
@@ -187,8 +346,8 @@ def get_setting(key: str, default: str = "") -> str:
 
 
 def set_setting(key: str, value: str) -> None:
-    with get_conn() as conn:
-        conn.execute(
+    _write(
+        (
             """
             INSERT INTO app_settings (key, value)
             VALUES (?, ?)
@@ -196,4 +355,4 @@ def set_setting(key: str, value: str) -> None:
             """,
             (key, value),
         )
-        conn.commit()
+    )
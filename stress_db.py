@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+import db
+
+DAYS = [f"2024-01-{d:02d}" for d in range(1, 29)]
+
+
+def _legacy_conn() -> sqlite3.Connection:
+    # Mirrors the original per-call connection: default timeout, no shared writer.
+    conn = sqlite3.connect(db.DB_PATH, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def legacy_upsert_check(day: str, section: str, item: str, checked: bool) -> None:
+    with _legacy_conn() as conn:
+        conn.execute(
+            """
+            INSERT INTO checks (day, section, item, checked)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(day, section, item)
+            DO UPDATE SET checked = excluded.checked
+            """,
+            (day, section, item, int(checked)),
+        )
+        conn.commit()
+
+
+def legacy_set_setting(key: str, value: str) -> None:
+    with _legacy_conn() as conn:
+        conn.execute(
+            """
+            INSERT INTO app_settings (key, value)
+            VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+            """,
+            (key, value),
+        )
+        conn.commit()
+
+
+def legacy_get_checks_for_day(day: str) -> dict[tuple[str, str], bool]:
+    with _legacy_conn() as conn:
+        rows = conn.execute(
+            "SELECT section, item, checked FROM checks WHERE day = ?", (day,)
+        ).fetchall()
+    return {(r["section"], r["item"]): bool(r["checked"]) for r in rows}
+
+
+MODES: dict[str, tuple[Callable[..., None], Callable[..., None], Callable[..., object]]] = {
+    "per-call connections": (legacy_upsert_check, legacy_set_setting, legacy_get_checks_for_day),
+    "writer queue": (db.upsert_check, db.set_setting, db.get_checks_for_day),
+}
+
+
+def run_mode(name: str, workdir: Path, threads: int, writes: int) -> None:
+    upsert_check, set_setting, get_checks_for_day = MODES[name]
+    db.DB_PATH = workdir / f"{name.replace(' ', '_')}.db"
+    db.init_db()
+    if name == "per-call connections":
+        # The original code ran in rollback-journal mode; init_db switches to WAL.
+        gc.collect()  # release init_db's connection so the journal mode can change
+        conn = sqlite3.connect(db.DB_PATH, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=DELETE")
+        conn.close()
+
+    lock_errors: list[str] = []
+    other_errors: list[str] = []
+    errors_lock = threading.Lock()
+
+    def worker(t: int) -> None:
+        day = DAYS[t % len(DAYS)]
+        for i in range(writes):
+            try:
+                upsert_check(day, "Stress", f"item-{t}-{i}", i % 2 == 0)
+                if i % 10 == 0:
+                    set_setting(f"stress_{t}", str(i))
+                    get_checks_for_day(day)
+            except sqlite3.OperationalError as exc:
+                with errors_lock:
+                    (lock_errors if "locked" in str(exc) else other_errors).append(repr(exc))
+            except Exception as exc:
+                with errors_lock:
+                    other_errors.append(repr(exc))
+
+    pool = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    started = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    total_writes = threads * (writes + (writes + 9) // 10)
+    print(
+        f"{name:>20}: {total_writes / elapsed:8.0f} writes/s, "
+        f"lock errors: {len(lock_errors)}, other errors: {len(other_errors)}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent read/write stress test for db.py")
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--writes", type=int, default=300, help="check upserts per thread")
+    args = parser.parse_args()
+
+    original_path = db.DB_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            for name in MODES:
+                run_mode(name, Path(tmp), args.threads, args.writes)
+        finally:
+            db.DB_PATH = original_path
+
+
+if __name__ == "__main__":
+    main()